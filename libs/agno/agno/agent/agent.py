@@ -11,6 +11,7 @@ from inspect import iscoroutinefunction
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -5748,7 +5749,9 @@ class Agent:
                 store_events=self.store_events,
             )
         else:
-            model_response_event = cast(ModelResponse, model_response_event)
+            if TYPE_CHECKING:
+                # Narrow the type for checkers only; a runtime cast() here would run once per streamed event
+                model_response_event = cast(ModelResponse, model_response_event)
             # If the model response is an assistant_response, yield a RunOutput
             if model_response_event.event == ModelResponseEvent.assistant_response.value:
                 content_type = "str"
@@ -9374,12 +9377,13 @@ class Agent:
         # Extract dependencies from run_context if available
         dependencies = run_context.dependencies if run_context else None
 
-        if num_documents is None and self.knowledge is not None:
-            num_documents = self.knowledge.max_results
+        knowledge = self.knowledge
+        if num_documents is None and knowledge is not None:
+            num_documents = knowledge.max_results
         # Validate the filters against known valid filter keys
-        if self.knowledge is not None and filters is not None:
+        if knowledge is not None and filters is not None:
             if validate_filters:
-                valid_filters, invalid_keys = self.knowledge.validate_filters(filters)  # type: ignore
+                valid_filters, invalid_keys = knowledge.validate_filters(filters)  # type: ignore
 
                 # Warn about invalid filter keys
                 if invalid_keys:
@@ -9418,20 +9422,18 @@ class Agent:
 
         # Use knowledge base search
         try:
-            if self.knowledge is None or (
-                (getattr(self.knowledge, "vector_db", None)) is None
-                and getattr(self.knowledge, "knowledge_retriever", None) is None
+            if knowledge is None or (
+                (getattr(knowledge, "vector_db", None)) is None
+                and getattr(knowledge, "knowledge_retriever", None) is None
             ):
                 return None
 
             if num_documents is None:
-                if isinstance(self.knowledge, Knowledge):
-                    num_documents = self.knowledge.max_results
+                if isinstance(knowledge, Knowledge):
+                    num_documents = knowledge.max_results
 
             log_debug(f"Searching knowledge base with filters: {filters}")
-            relevant_docs: List[Document] = self.knowledge.search(
-                query=query, max_results=num_documents, filters=filters
-            )
+            relevant_docs: List[Document] = knowledge.search(query=query, max_results=num_documents, filters=filters)
 
             if not relevant_docs or len(relevant_docs) == 0:
                 log_debug("No relevant documents found for query")
@@ -9457,13 +9459,14 @@ class Agent:
         # Extract dependencies from run_context if available
         dependencies = run_context.dependencies if run_context else None
 
-        if num_documents is None and self.knowledge is not None:
-            num_documents = self.knowledge.max_results
+        knowledge = self.knowledge
+        if num_documents is None and knowledge is not None:
+            num_documents = knowledge.max_results
 
         # Validate the filters against known valid filter keys
-        if self.knowledge is not None and filters is not None:
+        if knowledge is not None and filters is not None:
             if validate_filters:
-                valid_filters, invalid_keys = await self.knowledge.async_validate_filters(filters)  # type: ignore
+                valid_filters, invalid_keys = await knowledge.async_validate_filters(filters)  # type: ignore
 
                 # Warn about invalid filter keys
                 if invalid_keys:  # type: ignore
@@ -9506,17 +9509,17 @@ class Agent:
 
         # Use knowledge base search
         try:
-            if self.knowledge is None or (
-                getattr(self.knowledge, "vector_db", None) is None
-                and getattr(self.knowledge, "knowledge_retriever", None) is None
+            if knowledge is None or (
+                getattr(knowledge, "vector_db", None) is None
+                and getattr(knowledge, "knowledge_retriever", None) is None
             ):
                 return None
 
             if num_documents is None:
-                num_documents = self.knowledge.max_results
+                num_documents = knowledge.max_results
 
             log_debug(f"Searching knowledge base with filters: {filters}")
-            relevant_docs: List[Document] = await self.knowledge.async_search(
+            relevant_docs: List[Document] = await knowledge.async_search(
                 query=query, max_results=num_documents, filters=filters
             )
 
@@ -9592,6 +9595,9 @@ class Agent:
         fields_for_new_agent: Dict[str, Any] = {}
 
         for f in fields(self):
+            # Skip cloning fields the update dict overwrites anyway
+            if update and f.name in update:
+                continue
             field_value = getattr(self, f.name)
             if field_value is not None:
                 fields_for_new_agent[f.name] = self._deep_copy_field(f.name, field_value)
@@ -10355,14 +10361,14 @@ class Agent:
             """
             import json
 
-            history: List[Dict[str, Any]] = []
             all_chats = session.get_messages()
 
             if len(all_chats) == 0:
                 return ""
 
-            for chat in all_chats[::-1]:  # type: ignore
-                history.insert(0, chat.to_dict())  # type: ignore
+            # Single forward pass; the reversed copy + insert(0) dance rebuilt the
+            # original order at O(n^2)
+            history: List[Dict[str, Any]] = [chat.to_dict() for chat in all_chats]
 
             if num_chats is not None:
                 history = history[:num_chats]
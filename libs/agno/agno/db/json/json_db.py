@@ -1,6 +1,7 @@
 import json
 import os
 import time
+from contextlib import suppress
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
@@ -125,11 +126,17 @@ class JsonDb(BaseDb):
         # Create directory if it doesn't exist
         self.db_path.mkdir(parents=True, exist_ok=True)
 
+        # Write to a temporary file and rename it into place, so a crash mid-write
+        # can never leave a truncated table behind
+        tmp_path = self.db_path / f".{filename}.json.tmp"
         try:
-            with open(file_path, "w") as f:
+            with open(tmp_path, "w") as f:
                 json.dump(data, f, indent=2, default=str)
+            os.replace(tmp_path, file_path)
 
         except Exception as e:
+            with suppress(OSError):
+                os.remove(tmp_path)
             log_error(f"Error writing to the {file_path} JSON file: {e}")
             raise e
 
@@ -18,6 +18,7 @@ from agno.db.sqlite.utils import (
     abulk_upsert_metrics,
     ais_table_available,
     ais_valid_table,
+    apply_performance_pragmas,
     apply_sorting,
     calculate_date_metrics,
     deserialize_cultural_knowledge_from_db,
@@ -116,6 +117,10 @@ class AsyncSqliteDb(AsyncBaseDb):
                 db_file = str(default_db_path)
                 log_debug(f"Created SQLite database: {default_db_path}")
 
+            # Only tune engines we create; a user-provided engine keeps its own configuration
+            if _engine.url.get_backend_name() == "sqlite":
+                apply_performance_pragmas(_engine.sync_engine)
+
         self.db_engine: AsyncEngine = _engine
         self.db_url: Optional[str] = db_url
         self.db_file: Optional[str] = db_file
@@ -15,6 +15,7 @@ from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
 from agno.db.sqlite.schemas import get_table_schema_definition
 from agno.db.sqlite.utils import (
+    apply_performance_pragmas,
     apply_sorting,
     bulk_upsert_metrics,
     calculate_date_metrics,
@@ -117,6 +118,10 @@ class SqliteDb(BaseDb):
                 db_file = str(default_db_path)
                 log_debug(f"Created SQLite database: {default_db_path}")
 
+            # Only tune engines we create; a user-provided engine keeps its own configuration
+            if _engine.url.get_backend_name() == "sqlite":
+                apply_performance_pragmas(_engine)
+
         self.db_engine: Engine = _engine
         self.db_url: Optional[str] = db_url
         self.db_file: Optional[str] = db_file
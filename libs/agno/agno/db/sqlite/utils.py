@@ -21,6 +21,37 @@ except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
 
+# Pragmas applied to every new SQLite connection: WAL allows concurrent reads during
+# writes, synchronous=NORMAL halves fsyncs while staying crash-safe under WAL, and the
+# remaining pragmas keep temp structures and the page cache in memory.
+_SQLITE_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def apply_performance_pragmas(db_engine: Engine) -> None:
+    """Register a connect listener applying SQLite performance pragmas on every new connection.
+
+    Args:
+        db_engine: The engine to register the listener on. For async engines, pass the
+            underlying sync_engine.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(db_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in _SQLITE_CONNECT_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
 # -- DB util methods --
 
 
@@ -1,7 +1,8 @@
 import asyncio
+import mmap
 import re
 from pathlib import Path
-from typing import IO, Any, List, Optional, Tuple, Union
+from typing import IO, Any, AsyncIterator, Iterator, List, Optional, Tuple, Union, cast
 from uuid import uuid4
 
 from agno.knowledge.chunking.document import DocumentChunking
@@ -226,6 +227,19 @@ class BasePDFReader(Reader):
             return pdf_source.stem.replace(" ", "_")
         return getattr(pdf_source, "name", "pdf_file").split(".")[0].replace(" ", "_")
 
+    def _open_pdf_source(self, pdf_source: Union[str, Path, IO[Any]]) -> Union[str, Path, IO[Any]]:
+        """Memory-map path-based PDFs so pages are faulted in via the OS page cache on demand
+        instead of the whole file being buffered into RAM. Falls back to the original source
+        when the file cannot be mapped (e.g. empty files)."""
+        if isinstance(pdf_source, (str, Path)):
+            try:
+                with open(pdf_source, "rb") as pdf_file:
+                    # mmap duck-types the read/seek/tell interface pypdf needs
+                    return cast(IO[Any], mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ))
+            except (OSError, ValueError):
+                return pdf_source
+        return pdf_source
+
     def _decrypt_pdf(self, doc_reader: DocumentReader, doc_name: str, password: Optional[str] = None) -> bool:
         if not doc_reader.is_encrypted:
             return True
@@ -349,17 +363,22 @@ class PDFReader(BasePDFReader):
         doc_name = self._get_doc_name(pdf, name)
         log_debug(f"Reading: {doc_name}")
 
+        pdf_source = self._open_pdf_source(pdf)
         try:
-            pdf_reader = DocumentReader(pdf)
-        except PdfStreamError as e:
-            log_error(f"Error reading PDF: {e}")
-            return []
-        # Handle PDF decryption
-        if not self._decrypt_pdf(pdf_reader, doc_name, password):
-            return []
-
-        # Read and chunk
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+            try:
+                pdf_reader = DocumentReader(pdf_source)
+            except PdfStreamError as e:
+                log_error(f"Error reading PDF: {e}")
+                return []
+            # Handle PDF decryption
+            if not self._decrypt_pdf(pdf_reader, doc_name, password):
+                return []
+
+            # Read and chunk
+            return self._pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        finally:
+            if pdf_source is not pdf:
+                pdf_source.close()  # type: ignore[union-attr]
 
     async def async_read(
         self,
@@ -373,18 +392,78 @@ class PDFReader(BasePDFReader):
         doc_name = self._get_doc_name(pdf, name)
         log_debug(f"Reading: {doc_name}")
 
+        pdf_source = self._open_pdf_source(pdf)
         try:
-            pdf_reader = DocumentReader(pdf)
-        except PdfStreamError as e:
-            log_error(f"Error reading PDF: {e}")
-            return []
+            try:
+                pdf_reader = DocumentReader(pdf_source)
+            except PdfStreamError as e:
+                log_error(f"Error reading PDF: {e}")
+                return []
+
+            # Handle PDF decryption
+            if not self._decrypt_pdf(pdf_reader, doc_name, password):
+                return []
+
+            # Read and chunk.
+            return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        finally:
+            if pdf_source is not pdf:
+                pdf_source.close()  # type: ignore[union-attr]
+
+    def iter_pages(
+        self,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> Iterator[Document]:
+        """Yield one Document per page so large PDFs can be indexed incrementally.
 
-        # Handle PDF decryption
-        if not self._decrypt_pdf(pdf_reader, doc_name, password):
-            return []
+        Pages are parsed lazily and never held in memory together, bounding peak memory
+        to a single page instead of the full document text. Page-number cleanup is
+        skipped since it requires seeing every page up front.
+        """
+        if pdf is None:
+            log_error("No pdf provided")
+            return
+        doc_name = self._get_doc_name(pdf, name)
+        log_debug(f"Reading: {doc_name}")
 
-        # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        pdf_source = self._open_pdf_source(pdf)
+        try:
+            try:
+                pdf_reader = DocumentReader(pdf_source)
+            except PdfStreamError as e:
+                log_error(f"Error reading PDF: {e}")
+                return
+
+            # Handle PDF decryption
+            if not self._decrypt_pdf(pdf_reader, doc_name, password):
+                return
+
+            for page_number, page in enumerate(pdf_reader.pages, start=1):
+                document = Document(
+                    name=doc_name,
+                    id=str(uuid4()),
+                    meta_data={"page": page_number},
+                    content=page.extract_text(),
+                )
+                if self.chunk:
+                    yield from self.chunk_document(document)
+                else:
+                    yield document
+        finally:
+            if pdf_source is not pdf:
+                pdf_source.close()  # type: ignore[union-attr]
+
+    async def async_iter_pages(
+        self,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> AsyncIterator[Document]:
+        """Async variant of iter_pages. Yields one Document per page."""
+        for document in self.iter_pages(pdf, name, password):
+            yield document
 
 
 class PDFImageReader(BasePDFReader):
@@ -398,18 +477,23 @@ class PDFImageReader(BasePDFReader):
 
         doc_name = self._get_doc_name(pdf, name)
         log_debug(f"Reading: {doc_name}")
+        pdf_source = self._open_pdf_source(pdf)
         try:
-            pdf_reader = DocumentReader(pdf)
-        except PdfStreamError as e:
-            log_error(f"Error reading PDF: {e}")
-            return []
-
-        # Handle PDF decryption
-        if not self._decrypt_pdf(pdf_reader, doc_name, password):
-            return []
-
-        # Read and chunk.
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=True)
+            try:
+                pdf_reader = DocumentReader(pdf_source)
+            except PdfStreamError as e:
+                log_error(f"Error reading PDF: {e}")
+                return []
+
+            # Handle PDF decryption
+            if not self._decrypt_pdf(pdf_reader, doc_name, password):
+                return []
+
+            # Read and chunk.
+            return self._pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=True)
+        finally:
+            if pdf_source is not pdf:
+                pdf_source.close()  # type: ignore[union-attr]
 
     async def async_read(
         self, pdf: Union[str, Path, IO[Any]], name: Optional[str] = None, password: Optional[str] = None
@@ -420,15 +504,22 @@ class PDFImageReader(BasePDFReader):
         doc_name = self._get_doc_name(pdf, name)
         log_debug(f"Reading: {doc_name}")
 
+        pdf_source = self._open_pdf_source(pdf)
         try:
-            pdf_reader = DocumentReader(pdf)
-        except PdfStreamError as e:
-            log_error(f"Error reading PDF: {e}")
-            return []
-
-        # Handle PDF decryption
-        if not self._decrypt_pdf(pdf_reader, doc_name, password):
-            return []
-
-        # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=True)
+            try:
+                pdf_reader = DocumentReader(pdf_source)
+            except PdfStreamError as e:
+                log_error(f"Error reading PDF: {e}")
+                return []
+
+            # Handle PDF decryption
+            if not self._decrypt_pdf(pdf_reader, doc_name, password):
+                return []
+
+            # Read and chunk.
+            return await self._async_pdf_reader_to_documents(
+                pdf_reader, doc_name, read_images=True, use_uuid_for_id=True
+            )
+        finally:
+            if pdf_source is not pdf:
+                pdf_source.close()  # type: ignore[union-attr]
@@ -218,28 +218,28 @@ class ReaderFactory:
 
         return reader
 
+    # Extension/content-type → reader key, precomputed so per-file routing is a single dict lookup
+    _extension_reader_keys: Dict[str, str] = {
+        ".pdf": "pdf",
+        "application/pdf": "pdf",
+        ".csv": "csv",
+        "text/csv": "csv",
+        ".docx": "docx",
+        ".doc": "docx",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+        ".pptx": "pptx",
+        ".json": "json",
+        ".md": "markdown",
+        ".markdown": "markdown",
+        ".txt": "text",
+        ".text": "text",
+    }
+
     @classmethod
     def get_reader_for_extension(cls, extension: str) -> Reader:
         """Get the appropriate reader for a file extension."""
-        extension = extension.lower()
-
-        if extension in [".pdf", "application/pdf"]:
-            return cls.create_reader("pdf")
-        elif extension in [".csv", "text/csv"]:
-            return cls.create_reader("csv")
-        elif extension in [".docx", ".doc", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"]:
-            return cls.create_reader("docx")
-        elif extension == ".pptx":
-            return cls.create_reader("pptx")
-        elif extension == ".json":
-            return cls.create_reader("json")
-        elif extension in [".md", ".markdown"]:
-            return cls.create_reader("markdown")
-        elif extension in [".txt", ".text"]:
-            return cls.create_reader("text")
-        else:
-            # Default to text reader for unknown extensions
-            return cls.create_reader("text")
+        # Default to text reader for unknown extensions
+        return cls.create_reader(cls._extension_reader_keys.get(extension.lower(), "text"))
 
     @classmethod
     def get_reader_for_url(cls, url: str) -> Reader:
@@ -1,8 +1,9 @@
 import asyncio
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -28,7 +29,8 @@ class WebsiteReader(Reader):
     max_links: int = 10
 
     _visited: Set[str] = field(default_factory=set)
-    _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
+    # BFS frontier; deque gives O(1) pops from the head where a list pays O(n)
+    _urls_to_crawl: Deque[Tuple[str, int]] = field(default_factory=deque)
 
     def __init__(
         self,
@@ -46,7 +48,7 @@ class WebsiteReader(Reader):
         self.timeout = timeout
 
         self._visited = set()
-        self._urls_to_crawl = []
+        self._urls_to_crawl = deque()
 
     @classmethod
     def get_supported_chunking_strategies(self) -> List[ChunkingStrategyType]:
@@ -167,7 +169,7 @@ class WebsiteReader(Reader):
         self._urls_to_crawl.append((url, starting_depth))
         while self._urls_to_crawl:
             # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
+            current_url, current_depth = self._urls_to_crawl.popleft()
 
             # Skip if
             # - URL is already visited
@@ -277,12 +279,12 @@ class WebsiteReader(Reader):
 
         # Clear previously visited URLs and URLs to crawl
         self._visited = set()
-        self._urls_to_crawl = [(url, starting_depth)]
+        self._urls_to_crawl = deque([(url, starting_depth)])
 
         client_args = {"proxy": self.proxy} if self.proxy else {}
         async with httpx.AsyncClient(**client_args) as client:  # type: ignore
             while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
+                current_url, current_depth = self._urls_to_crawl.popleft()
 
                 if (
                     current_url in self._visited
@@ -2,7 +2,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
 
 from agno.utils.log import log_error
 
@@ -51,18 +51,23 @@ class Image(BaseModel):
 
         return data
 
+    # Caches URL/file content so repeated payload builds fetch the bytes only once
+    _content_bytes: Optional[bytes] = PrivateAttr(default=None)
+
     def get_content_bytes(self) -> Optional[bytes]:
         """Get image content as raw bytes, loading from URL/file if needed"""
         if self.content:
             return self.content
-        elif self.url:
+        if self._content_bytes is not None:
+            return self._content_bytes
+        if self.url:
             import httpx
 
-            return httpx.get(self.url).content
+            self._content_bytes = httpx.get(self.url).content
         elif self.filepath:
             with open(self.filepath, "rb") as f:
-                return f.read()
-        return None
+                self._content_bytes = f.read()
+        return self._content_bytes
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string for transmission/storage"""
@@ -153,18 +158,23 @@ class Audio(BaseModel):
 
         return data
 
+    # Caches URL/file content so repeated payload builds fetch the bytes only once
+    _content_bytes: Optional[bytes] = PrivateAttr(default=None)
+
     def get_content_bytes(self) -> Optional[bytes]:
         """Get audio content as raw bytes"""
         if self.content:
             return self.content
-        elif self.url:
+        if self._content_bytes is not None:
+            return self._content_bytes
+        if self.url:
             import httpx
 
-            return httpx.get(self.url).content
+            self._content_bytes = httpx.get(self.url).content
         elif self.filepath:
             with open(self.filepath, "rb") as f:
-                return f.read()
-        return None
+                self._content_bytes = f.read()
+        return self._content_bytes
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string"""
@@ -271,18 +281,23 @@ class Video(BaseModel):
 
         return data
 
+    # Caches URL/file content so repeated payload builds fetch the bytes only once
+    _content_bytes: Optional[bytes] = PrivateAttr(default=None)
+
     def get_content_bytes(self) -> Optional[bytes]:
         """Get video content as raw bytes"""
         if self.content:
             return self.content
-        elif self.url:
+        if self._content_bytes is not None:
+            return self._content_bytes
+        if self.url:
             import httpx
 
-            return httpx.get(self.url).content
+            self._content_bytes = httpx.get(self.url).content
         elif self.filepath:
             with open(self.filepath, "rb") as f:
-                return f.read()
-        return None
+                self._content_bytes = f.read()
+        return self._content_bytes
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string"""
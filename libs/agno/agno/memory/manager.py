@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from os import getenv
 from textwrap import dedent
 from typing import Any, Callable, Dict, List, Literal, Optional, Type, Union
+from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
@@ -192,15 +193,9 @@ class MemoryManager:
         if self.db:
             if user_id is None:
                 user_id = "default"
-            # Refresh from the DB
-            memories = self.read_from_db(user_id=user_id)
-            if memories is None:
-                return None
-            memories_for_user = memories.get(user_id, [])
-            for memory in memories_for_user:
-                if memory.memory_id == memory_id:
-                    return memory
-            return None
+            # Fetch the single row by id instead of re-reading every memory for
+            # the user and scanning for a match
+            return self.db.get_user_memory(memory_id=memory_id, user_id=user_id)  # type: ignore
         else:
             log_warning("Memory Db not provided.")
             return None
@@ -219,8 +214,6 @@ class MemoryManager:
         """
         if self.db:
             if memory.memory_id is None:
-                from uuid import uuid4
-
                 memory_id = memory.memory_id or str(uuid4())
                 memory.memory_id = memory_id
 
@@ -410,9 +403,6 @@ class MemoryManager:
             update_memories=self.update_memories,
             add_memories=self.add_memories,
         )
-
-        # We refresh from the DB
-        self.read_from_db(user_id=user_id)
         return response
 
     async def acreate_user_memories(
@@ -462,13 +452,6 @@ class MemoryManager:
             update_memories=self.update_memories,
             add_memories=self.add_memories,
         )
-
-        # We refresh from the DB
-        if isinstance(self.db, AsyncBaseDb):
-            memories = await self.aread_from_db(user_id=user_id)
-        else:
-            memories = self.read_from_db(user_id=user_id)
-
         return response
 
     def update_memory_task(self, task: str, user_id: Optional[str] = None) -> str:
@@ -504,9 +487,6 @@ class MemoryManager:
             clear_memories=self.clear_memories,
         )
 
-        # We refresh from the DB
-        self.read_from_db(user_id=user_id)
-
         return response
 
     async def aupdate_memory_task(self, task: str, user_id: Optional[str] = None) -> str:
@@ -542,12 +522,6 @@ class MemoryManager:
             clear_memories=self.clear_memories,
         )
 
-        # We refresh from the DB
-        if isinstance(self.db, AsyncBaseDb):
-            await self.aread_from_db(user_id=user_id)
-        else:
-            self.read_from_db(user_id=user_id)
-
         return response
 
     # -*- Memory Db Functions
@@ -843,8 +817,6 @@ class MemoryManager:
             for opt_mem in optimized_memories:
                 # Ensure memory has an ID (generate if needed for new memories)
                 if not opt_mem.memory_id:
-                    from uuid import uuid4
-
                     opt_mem.memory_id = str(uuid4())
 
                 self.db.upsert_user_memory(memory=opt_mem)
@@ -913,8 +885,6 @@ class MemoryManager:
             for opt_mem in optimized_memories:
                 # Ensure memory has an ID (generate if needed for new memories)
                 if not opt_mem.memory_id:
-                    from uuid import uuid4
-
                     opt_mem.memory_id = str(uuid4())
 
                 if isinstance(self.db, AsyncBaseDb):
@@ -1315,10 +1285,6 @@ class MemoryManager:
             Returns:
                 str: A message indicating if the memory was added successfully or not.
             """
-            from uuid import uuid4
-
-            from agno.db.base import UserMemory
-
             try:
                 memory_id = str(uuid4())
                 db.upsert_user_memory(
@@ -1347,8 +1313,6 @@ class MemoryManager:
             Returns:
                 str: A message indicating if the memory was updated successfully or not.
             """
-            from agno.db.base import UserMemory
-
             if memory == "":
                 return "Can't update memory with empty string. Use the delete memory function if available."
 
@@ -1424,10 +1388,6 @@ class MemoryManager:
             Returns:
                 str: A message indicating if the memory was added successfully or not.
             """
-            from uuid import uuid4
-
-            from agno.db.base import UserMemory
-
             try:
                 memory_id = str(uuid4())
                 if isinstance(db, AsyncBaseDb):
@@ -1469,8 +1429,6 @@ class MemoryManager:
             Returns:
                 str: A message indicating if the memory was updated successfully or not.
             """
-            from agno.db.base import UserMemory
-
             if memory == "":
                 return "Can't update memory with empty string. Use the delete memory function if available."
 
@@ -2652,6 +2652,11 @@ class Model(ABC):
             if k in {"client", "async_client", "http_client", "mistral_client", "model_client"}:
                 setattr(new_model, k, None)
                 continue
+            # Most model attributes are immutable scalars; assign them directly
+            # instead of paying deepcopy dispatch and memo bookkeeping for each one
+            if v is None or type(v) in (bool, int, float, str, bytes):
+                setattr(new_model, k, v)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
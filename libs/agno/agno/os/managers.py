@@ -16,12 +16,12 @@ from typing import Any, Dict, List, Optional, Union
 
 from starlette.websockets import WebSocket
 
+from agno.os.utils import serialize_event_dict
 from agno.run.agent import RunOutputEvent
 from agno.run.base import RunStatus
 from agno.run.team import TeamRunOutputEvent
 from agno.run.workflow import WorkflowRunOutputEvent
 from agno.utils.log import log_debug, log_warning, logger
-from agno.utils.serialize import json_serializer
 
 
 @dataclass
@@ -30,26 +30,6 @@ class WebSocketHandler:
 
     websocket: Optional[WebSocket] = None
 
-    def format_sse_event(self, json_data: str) -> str:
-        """Parse JSON data into SSE-compliant format.
-
-        Args:
-            json_data: JSON string containing the event data
-
-        Returns:
-            SSE-formatted response with event type and data
-        """
-        try:
-            # Parse the JSON to extract the event type
-            data = json.loads(json_data)
-            event_type = data.get("event", "message")
-
-            # Format as SSE: event: <event_type>\ndata: <json_data>\n\n
-            return f"event: {event_type}\ndata: {json_data}\n\n"
-        except (json.JSONDecodeError, KeyError):
-            # Fallback to generic message event if parsing fails
-            return f"event: message\ndata: {json_data}\n\n"
-
     async def handle_event(
         self,
         event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent],
@@ -78,7 +58,10 @@ class WebSocketHandler:
             if run_id and "run_id" not in data:
                 data["run_id"] = run_id
 
-            await self.websocket.send_text(self.format_sse_event(json.dumps(data, default=json_serializer)))
+            # Serialize once and read the event type off the dict directly instead of
+            # round-tripping the payload through json.dumps + json.loads
+            event_type = data.get("event", "message")
+            await self.websocket.send_text(f"event: {event_type}\ndata: {serialize_event_dict(data)}\n\n")
 
         except RuntimeError as e:
             if "websocket.close" in str(e).lower() or "already completed" in str(e).lower():
@@ -1,5 +1,7 @@
+import asyncio
 import json
-from typing import TYPE_CHECKING, Any, AsyncGenerator, List, Optional, Union, cast
+import logging
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union, cast
 from uuid import uuid4
 
 from fastapi import (
@@ -30,20 +32,81 @@ from agno.os.schema import (
 )
 from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
+    aprocess_audio,
+    aprocess_document,
+    aprocess_image,
+    aprocess_video,
+    coalesce_sse_events,
     format_sse_event,
     get_agent_by_id,
     get_request_kwargs,
-    process_audio,
-    process_document,
-    process_image,
-    process_video,
 )
 from agno.run.agent import RunErrorEvent, RunOutput
-from agno.utils.log import log_debug, log_error, log_warning
+from agno.utils.log import log_debug, log_error, log_warning, logger
 
 if TYPE_CHECKING:
     from agno.os.app import AgentOS
 
+# Supported upload content types, precomputed so per-file checks are O(1) set lookups
+_IMAGE_CONTENT_TYPES = frozenset(
+    {
+        "image/png",
+        "image/jpeg",
+        "image/jpg",
+        "image/gif",
+        "image/webp",
+        "image/bmp",
+        "image/tiff",
+        "image/tif",
+        "image/avif",
+    }
+)
+_AUDIO_CONTENT_TYPES = frozenset(
+    {
+        "audio/wav",
+        "audio/wave",
+        "audio/mp3",
+        "audio/mpeg",
+        "audio/ogg",
+        "audio/mp4",
+        "audio/m4a",
+        "audio/aac",
+        "audio/flac",
+    }
+)
+_VIDEO_CONTENT_TYPES = frozenset(
+    {
+        "video/x-flv",
+        "video/quicktime",
+        "video/mpeg",
+        "video/mpegs",
+        "video/mpgs",
+        "video/mpg",
+        "video/mp4",
+        "video/webm",
+        "video/wmv",
+        "video/3gpp",
+    }
+)
+_DOCUMENT_CONTENT_TYPES = frozenset(
+    {
+        "application/pdf",
+        "application/json",
+        "application/x-javascript",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "text/javascript",
+        "application/x-python",
+        "text/x-python",
+        "text/plain",
+        "text/html",
+        "text/css",
+        "text/md",
+        "text/csv",
+        "text/xml",
+        "text/rtf",
+    }
+)
+
 
 async def agent_response_streamer(
     agent: Union[Agent, RemoteAgent],
@@ -95,9 +158,11 @@ async def agent_response_streamer(
         )
         yield format_sse_event(error_response)
     except Exception as e:
-        import traceback
+        log_error(f"Error in agent run stream: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            import traceback
 
-        traceback.print_exc(limit=3)
+            log_error(traceback.format_exc(limit=3))
         error_response = RunErrorEvent(
             content=str(e),
         )
@@ -141,9 +206,11 @@ async def agent_continue_response_streamer(
         yield format_sse_event(error_response)
 
     except Exception as e:
-        import traceback
+        log_error(f"Error in agent continue stream: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            import traceback
 
-        traceback.print_exc(limit=3)
+            log_error(traceback.format_exc(limit=3))
         error_response = RunErrorEvent(
             content=str(e),
             error_type=e.type if hasattr(e, "type") else None,
@@ -171,6 +238,17 @@ def get_agent_router(
         },
     )
 
+    # {id: agent} index filled lazily so per-request lookups are O(1) instead of scanning os.agents
+    agent_index: Dict[str, Union[Agent, RemoteAgent]] = {}
+
+    def lookup_agent(agent_id: str) -> Optional[Union[Agent, RemoteAgent]]:
+        agent = agent_index.get(agent_id)
+        if agent is None:
+            agent = get_agent_by_id(agent_id, os.agents)
+            if agent is not None:
+                agent_index[agent_id] = agent
+        return agent
+
     @router.post(
         "/agents/{agent_id}/runs",
         tags=["Agents"],
@@ -243,7 +321,7 @@ def get_agent_router(
                 log_warning("Metadata parameter passed in both request state and kwargs, using request state")
             kwargs["metadata"] = metadata
 
-        agent = get_agent_by_id(agent_id, os.agents)
+        agent = lookup_agent(agent_id)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
 
@@ -257,104 +335,70 @@ def get_agent_router(
         input_files: List[FileMedia] = []
 
         if files:
-            for file in files:
-                if file.content_type in [
-                    "image/png",
-                    "image/jpeg",
-                    "image/jpg",
-                    "image/gif",
-                    "image/webp",
-                    "image/bmp",
-                    "image/tiff",
-                    "image/tif",
-                    "image/avif",
-                ]:
+
+            async def process_file(file: UploadFile) -> Optional[tuple]:
+                """Read and wrap a single upload. Returns (kind, media), or None when processing failed."""
+                # The startswith prefix check fails fast for non-matching media before paying the set lookup
+                content_type = file.content_type or ""
+                if content_type.startswith("image/") and content_type in _IMAGE_CONTENT_TYPES:
                     try:
-                        base64_image = process_image(file)
-                        base64_images.append(base64_image)
+                        return "image", await aprocess_image(file)
                     except Exception as e:
                         log_error(f"Error processing image {file.filename}: {e}")
-                        continue
-                elif file.content_type in [
-                    "audio/wav",
-                    "audio/wave",
-                    "audio/mp3",
-                    "audio/mpeg",
-                    "audio/ogg",
-                    "audio/mp4",
-                    "audio/m4a",
-                    "audio/aac",
-                    "audio/flac",
-                ]:
+                        return None
+                elif content_type.startswith("audio/") and content_type in _AUDIO_CONTENT_TYPES:
                     try:
-                        audio = process_audio(file)
-                        base64_audios.append(audio)
+                        return "audio", await aprocess_audio(file)
                     except Exception as e:
                         log_error(f"Error processing audio {file.filename} with content type {file.content_type}: {e}")
-                        continue
-                elif file.content_type in [
-                    "video/x-flv",
-                    "video/quicktime",
-                    "video/mpeg",
-                    "video/mpegs",
-                    "video/mpgs",
-                    "video/mpg",
-                    "video/mpg",
-                    "video/mp4",
-                    "video/webm",
-                    "video/wmv",
-                    "video/3gpp",
-                ]:
+                        return None
+                elif content_type.startswith("video/") and content_type in _VIDEO_CONTENT_TYPES:
                     try:
-                        base64_video = process_video(file)
-                        base64_videos.append(base64_video)
+                        return "video", await aprocess_video(file)
                     except Exception as e:
                         log_error(f"Error processing video {file.filename}: {e}")
-                        continue
-                elif file.content_type in [
-                    "application/pdf",
-                    "application/json",
-                    "application/x-javascript",
-                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    "text/javascript",
-                    "application/x-python",
-                    "text/x-python",
-                    "text/plain",
-                    "text/html",
-                    "text/css",
-                    "text/md",
-                    "text/csv",
-                    "text/xml",
-                    "text/rtf",
-                ]:
+                        return None
+                elif content_type in _DOCUMENT_CONTENT_TYPES:
                     # Process document files
                     try:
-                        input_file = process_document(file)
-                        if input_file is not None:
-                            input_files.append(input_file)
+                        input_file = await aprocess_document(file)
+                        return ("file", input_file) if input_file is not None else None
                     except Exception as e:
                         log_error(f"Error processing file {file.filename}: {e}")
-                        continue
+                        return None
                 else:
                     raise HTTPException(status_code=400, detail="Unsupported file type")
 
+            # Process all uploads concurrently; gather preserves the upload order in the outputs
+            media_lists: Dict[str, List[Any]] = {
+                "image": base64_images,
+                "audio": base64_audios,
+                "video": base64_videos,
+                "file": input_files,
+            }
+            for processed in await asyncio.gather(*(process_file(file) for file in files)):
+                if processed is not None:
+                    media_lists[processed[0]].append(processed[1])
+
         # Extract auth token for remote agents
         auth_token = get_auth_token_from_request(request)
 
         if stream:
             return StreamingResponse(
-                agent_response_streamer(
-                    agent,
-                    message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    images=base64_images if base64_images else None,
-                    audio=base64_audios if base64_audios else None,
-                    videos=base64_videos if base64_videos else None,
-                    files=input_files if input_files else None,
-                    background_tasks=background_tasks,
-                    auth_token=auth_token,
-                    **kwargs,
+                coalesce_sse_events(
+                    agent_response_streamer(
+                        agent,
+                        message,
+                        session_id=session_id,
+                        user_id=user_id,
+                        images=base64_images if base64_images else None,
+                        audio=base64_audios if base64_audios else None,
+                        videos=base64_videos if base64_videos else None,
+                        files=input_files if input_files else None,
+                        background_tasks=background_tasks,
+                        auth_token=auth_token,
+                        **kwargs,
+                    )
                 ),
                 media_type="text/event-stream",
             )
@@ -405,7 +449,7 @@ def get_agent_router(
         agent_id: str,
         run_id: str,
     ):
-        agent = get_agent_by_id(agent_id, os.agents)
+        agent = lookup_agent(agent_id)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
 
@@ -464,7 +508,7 @@ def get_agent_router(
         except json.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid JSON in tools field")
 
-        agent = get_agent_by_id(agent_id, os.agents)
+        agent = lookup_agent(agent_id)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
 
@@ -488,14 +532,16 @@ def get_agent_router(
 
         if stream:
             return StreamingResponse(
-                agent_continue_response_streamer(
-                    agent,
-                    run_id=run_id,  # run_id from path
-                    updated_tools=updated_tools,
-                    session_id=session_id,
-                    user_id=user_id,
-                    background_tasks=background_tasks,
-                    auth_token=auth_token,
+                coalesce_sse_events(
+                    agent_continue_response_streamer(
+                        agent,
+                        run_id=run_id,  # run_id from path
+                        updated_tools=updated_tools,
+                        session_id=session_id,
+                        user_id=user_id,
+                        background_tasks=background_tasks,
+                        auth_token=auth_token,
+                    )
                 ),
                 media_type="text/event-stream",
             )
@@ -630,7 +676,7 @@ def get_agent_router(
         dependencies=[Depends(require_resource_access("agents", "read", "agent_id"))],
     )
     async def get_agent(agent_id: str, request: Request) -> AgentResponse:
-        agent = get_agent_by_id(agent_id, os.agents)
+        agent = lookup_agent(agent_id)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
 
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 from agno.os.schema import HealthResponse
 
@@ -10,6 +11,12 @@ def get_health_router(health_endpoint: str = "/health") -> APIRouter:
 
     started_time_stamp = datetime.now(timezone.utc).timestamp()
 
+    # The payload never changes after startup, so build the response once and reuse it
+    # instead of validating and serializing a HealthResponse on every liveness probe
+    health_response = JSONResponse(
+        content=HealthResponse(status="ok", instantiated_at=str(started_time_stamp)).model_dump()
+    )
+
     @router.get(
         health_endpoint,
         operation_id="health_check",
@@ -25,7 +32,7 @@ def get_health_router(health_endpoint: str = "/health") -> APIRouter:
             }
         },
     )
-    async def health_check() -> HealthResponse:
-        return HealthResponse(status="ok", instantiated_at=str(started_time_stamp))
+    async def health_check() -> JSONResponse:
+        return health_response
 
     return router
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Any, AsyncGenerator, List, Optional, Union
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union
 from uuid import uuid4
 
 from fastapi import (
@@ -27,13 +29,14 @@ from agno.os.schema import (
 )
 from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
+    aprocess_audio,
+    aprocess_document,
+    aprocess_image,
+    aprocess_video,
+    coalesce_sse_events,
     format_sse_event,
     get_request_kwargs,
     get_team_by_id,
-    process_audio,
-    process_document,
-    process_image,
-    process_video,
 )
 from agno.run.team import RunErrorEvent as TeamRunErrorEvent
 from agno.team.remote import RemoteTeam
@@ -43,6 +46,33 @@ from agno.utils.log import log_warning, logger
 if TYPE_CHECKING:
     from agno.os.app import AgentOS
 
+# Supported upload content types, precomputed so per-file checks are O(1) set lookups
+_IMAGE_CONTENT_TYPES = frozenset({"image/png", "image/jpeg", "image/jpg", "image/webp"})
+_AUDIO_CONTENT_TYPES = frozenset({"audio/wav", "audio/mp3", "audio/mpeg"})
+_VIDEO_CONTENT_TYPES = frozenset(
+    {
+        "video/x-flv",
+        "video/quicktime",
+        "video/mpeg",
+        "video/mpegs",
+        "video/mpgs",
+        "video/mpg",
+        "video/mp4",
+        "video/webm",
+        "video/wmv",
+        "video/3gpp",
+    }
+)
+_DOCUMENT_CONTENT_TYPES = frozenset(
+    {
+        "application/pdf",
+        "text/csv",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "text/plain",
+        "application/json",
+    }
+)
+
 
 async def team_response_streamer(
     team: Union[Team, RemoteTeam],
@@ -96,9 +126,11 @@ async def team_response_streamer(
         yield format_sse_event(error_response)
 
     except BaseException as e:
-        import traceback
+        logger.error(f"Error in team run stream: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            import traceback
 
-        traceback.print_exc()
+            logger.error(traceback.format_exc())
         error_response = TeamRunErrorEvent(
             content=str(e),
             error_type=e.type if hasattr(e, "type") else None,
@@ -124,6 +156,17 @@ def get_team_router(
         },
     )
 
+    # {id: team} index filled lazily so per-request lookups are O(1) instead of scanning os.teams
+    team_index: Dict[str, Union[Team, RemoteTeam]] = {}
+
+    def lookup_team(team_id: str) -> Optional[Union[Team, RemoteTeam]]:
+        team = team_index.get(team_id)
+        if team is None:
+            team = get_team_by_id(team_id, os.teams)
+            if team is not None:
+                team_index[team_id] = team
+        return team
+
     @router.post(
         "/teams/{team_id}/runs",
         tags=["Teams"],
@@ -194,7 +237,7 @@ def get_team_router(
 
         logger.debug(f"Creating team run: {message=} {session_id=} {monitor=} {user_id=} {team_id=} {files=} {kwargs=}")
 
-        team = get_team_by_id(team_id, os.teams)
+        team = lookup_team(team_id)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
 
@@ -210,70 +253,65 @@ def get_team_router(
         document_files: List[FileMedia] = []
 
         if files:
-            for file in files:
-                if file.content_type in ["image/png", "image/jpeg", "image/jpg", "image/webp"]:
+
+            async def process_file(file: UploadFile) -> Optional[tuple]:
+                """Read and wrap a single upload. Returns (kind, media), or None when processing failed."""
+                # The startswith prefix check fails fast for non-matching media before paying the set lookup
+                content_type = file.content_type or ""
+                if content_type.startswith("image/") and content_type in _IMAGE_CONTENT_TYPES:
                     try:
-                        base64_image = process_image(file)
-                        base64_images.append(base64_image)
+                        return "image", await aprocess_image(file)
                     except Exception as e:
                         logger.error(f"Error processing image {file.filename}: {e}")
-                        continue
-                elif file.content_type in ["audio/wav", "audio/mp3", "audio/mpeg"]:
+                        return None
+                elif content_type.startswith("audio/") and content_type in _AUDIO_CONTENT_TYPES:
                     try:
-                        base64_audio = process_audio(file)
-                        base64_audios.append(base64_audio)
+                        return "audio", await aprocess_audio(file)
                     except Exception as e:
                         logger.error(f"Error processing audio {file.filename}: {e}")
-                        continue
-                elif file.content_type in [
-                    "video/x-flv",
-                    "video/quicktime",
-                    "video/mpeg",
-                    "video/mpegs",
-                    "video/mpgs",
-                    "video/mpg",
-                    "video/mpg",
-                    "video/mp4",
-                    "video/webm",
-                    "video/wmv",
-                    "video/3gpp",
-                ]:
+                        return None
+                elif content_type.startswith("video/") and content_type in _VIDEO_CONTENT_TYPES:
                     try:
-                        base64_video = process_video(file)
-                        base64_videos.append(base64_video)
+                        return "video", await aprocess_video(file)
                     except Exception as e:
                         logger.error(f"Error processing video {file.filename}: {e}")
-                        continue
-                elif file.content_type in [
-                    "application/pdf",
-                    "text/csv",
-                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    "text/plain",
-                    "application/json",
-                ]:
-                    document_file = process_document(file)
-                    if document_file is not None:
-                        document_files.append(document_file)
+                        return None
+                elif content_type in _DOCUMENT_CONTENT_TYPES:
+                    document_file = await aprocess_document(file)
+                    return ("file", document_file) if document_file is not None else None
                 else:
                     raise HTTPException(status_code=400, detail="Unsupported file type")
 
+            # Process all uploads concurrently; gather preserves the upload order in the outputs
+            media_lists: Dict[str, List[Any]] = {
+                "image": base64_images,
+                "audio": base64_audios,
+                "video": base64_videos,
+                "file": document_files,
+            }
+            for processed in await asyncio.gather(*(process_file(file) for file in files)):
+                if processed is not None:
+                    media_lists[processed[0]].append(processed[1])
+
         # Extract auth token for remote teams
         auth_token = get_auth_token_from_request(request)
 
         if stream:
             return StreamingResponse(
-                team_response_streamer(
-                    team,
-                    message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    images=base64_images if base64_images else None,
-                    audio=base64_audios if base64_audios else None,
-                    videos=base64_videos if base64_videos else None,
-                    files=document_files if document_files else None,
-                    background_tasks=background_tasks,
-                    auth_token=auth_token,
-                    **kwargs,
+                coalesce_sse_events(
+                    team_response_streamer(
+                        team,
+                        message,
+                        session_id=session_id,
+                        user_id=user_id,
+                        images=base64_images if base64_images else None,
+                        audio=base64_audios if base64_audios else None,
+                        videos=base64_videos if base64_videos else None,
+                        files=document_files if document_files else None,
+                        background_tasks=background_tasks,
+                        auth_token=auth_token,
+                        **kwargs,
+                    )
                 ),
                 media_type="text/event-stream",
             )
@@ -321,7 +359,7 @@ def get_team_router(
         team_id: str,
         run_id: str,
     ):
-        team = get_team_by_id(team_id, os.teams)
+        team = lookup_team(team_id)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
 
@@ -526,7 +564,7 @@ def get_team_router(
         dependencies=[Depends(require_resource_access("teams", "read", "team_id"))],
     )
     async def get_team(team_id: str, request: Request) -> TeamResponse:
-        team = get_team_by_id(team_id, os.teams)
+        team = lookup_team(team_id)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
 
@@ -1,4 +1,5 @@
 import json
+import logging
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union
 from uuid import uuid4
 
@@ -33,14 +34,15 @@ from agno.os.schema import (
 )
 from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
+    coalesce_sse_events,
     format_sse_event,
     get_request_kwargs,
     get_workflow_by_id,
+    serialize_event_dict,
 )
 from agno.run.base import RunStatus
 from agno.run.workflow import WorkflowErrorEvent
 from agno.utils.log import log_debug, log_warning, logger
-from agno.utils.serialize import json_serializer
 from agno.workflow.remote import RemoteWorkflow
 from agno.workflow.workflow import Workflow
 
@@ -168,7 +170,7 @@ async def handle_workflow_subscription(websocket: WebSocket, message: dict, os:
                                 if "run_id" not in event_dict:
                                     event_dict["run_id"] = run_id
 
-                                await websocket.send_text(json.dumps(event_dict, default=json_serializer))
+                                await websocket.send_text(serialize_event_dict(event_dict))
                         else:
                             await websocket.send_text(
                                 json.dumps(
@@ -216,7 +218,7 @@ async def handle_workflow_subscription(websocket: WebSocket, message: dict, os:
                 if "run_id" not in event_dict:
                     event_dict["run_id"] = run_id
 
-                await websocket.send_text(json.dumps(event_dict))
+                await websocket.send_text(serialize_event_dict(event_dict))
             return
 
         # Run is still active - send missed events and subscribe to new ones
@@ -249,7 +251,7 @@ async def handle_workflow_subscription(websocket: WebSocket, message: dict, os:
                 if "run_id" not in event_dict:
                     event_dict["run_id"] = run_id
 
-                await websocket.send_text(json.dumps(event_dict))
+                await websocket.send_text(serialize_event_dict(event_dict))
 
         # Register websocket for future events
         await websocket_manager.register_websocket(run_id, websocket)
@@ -326,9 +328,11 @@ async def workflow_response_streamer(
         yield format_sse_event(error_response)
 
     except Exception as e:
-        import traceback
+        logger.error(f"Error in workflow run stream: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            import traceback
 
-        traceback.print_exc()
+            logger.error(traceback.format_exc())
         error_response = WorkflowErrorEvent(
             error=str(e),
             error_type=e.type if hasattr(e, "type") else None,
@@ -492,6 +496,17 @@ def get_workflow_router(
         },
     )
 
+    # {id: workflow} index filled lazily so per-request lookups are O(1) instead of scanning os.workflows
+    workflow_index: Dict[str, Union[Workflow, RemoteWorkflow]] = {}
+
+    def lookup_workflow(workflow_id: str) -> Optional[Union[Workflow, RemoteWorkflow]]:
+        workflow = workflow_index.get(workflow_id)
+        if workflow is None:
+            workflow = get_workflow_by_id(workflow_id, os.workflows)
+            if workflow is not None:
+                workflow_index[workflow_id] = workflow
+        return workflow
+
     @router.get(
         "/workflows",
         response_model=List[WorkflowSummaryResponse],
@@ -571,7 +586,7 @@ def get_workflow_router(
         dependencies=[Depends(require_resource_access("workflows", "read", "workflow_id"))],
     )
     async def get_workflow(workflow_id: str, request: Request) -> WorkflowResponse:
-        workflow = get_workflow_by_id(workflow_id, os.workflows)
+        workflow = lookup_workflow(workflow_id)
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
         if isinstance(workflow, RemoteWorkflow):
@@ -650,7 +665,7 @@ def get_workflow_router(
             kwargs["metadata"] = metadata
 
         # Retrieve the workflow by ID
-        workflow = get_workflow_by_id(workflow_id, os.workflows)
+        workflow = lookup_workflow(workflow_id)
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
@@ -667,14 +682,16 @@ def get_workflow_router(
         try:
             if stream:
                 return StreamingResponse(
-                    workflow_response_streamer(
-                        workflow,
-                        input=message,
-                        session_id=session_id,
-                        user_id=user_id,
-                        background_tasks=background_tasks,
-                        auth_token=auth_token,
-                        **kwargs,
+                    coalesce_sse_events(
+                        workflow_response_streamer(
+                            workflow,
+                            input=message,
+                            session_id=session_id,
+                            user_id=user_id,
+                            background_tasks=background_tasks,
+                            auth_token=auth_token,
+                            **kwargs,
+                        )
                     ),
                     media_type="text/event-stream",
                 )
@@ -716,7 +733,7 @@ def get_workflow_router(
         dependencies=[Depends(require_resource_access("workflows", "run", "workflow_id"))],
     )
     async def cancel_workflow_run(workflow_id: str, run_id: str):
-        workflow = get_workflow_by_id(workflow_id, os.workflows)
+        workflow = lookup_workflow(workflow_id)
 
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
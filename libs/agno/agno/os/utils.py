@@ -1,6 +1,8 @@
+import asyncio
 import json
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Set, Type, Union
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Type, Union
 
 from fastapi import FastAPI, HTTPException, Request, UploadFile
 from fastapi.routing import APIRoute, APIRouter
@@ -21,8 +23,30 @@ from agno.run.workflow import WorkflowRunOutputEvent
 from agno.team import RemoteTeam, Team
 from agno.tools import Function, Toolkit
 from agno.utils.log import log_warning, logger
+from agno.utils.serialize import json_serializer
 from agno.workflow import RemoteWorkflow, Workflow
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _json_loads(value: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when installed; orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so callers can keep catching the stdlib exception."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+@lru_cache(maxsize=None)
+def _endpoint_known_fields(endpoint_func: Callable) -> frozenset:
+    """Parameter names of an endpoint function, cached so the signature is inspected once."""
+    import inspect
+
+    return frozenset(inspect.signature(endpoint_func).parameters.keys())
+
 
 async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[str, Any]:
     """Given a Request and an endpoint function, return a dictionary with all extra form data fields.
@@ -42,18 +66,15 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     Returns:
         A dictionary of kwargs to pass to Agent/Team run methods
     """
-    import inspect
-
     form_data = await request.form()
-    sig = inspect.signature(endpoint_func)
-    known_fields = set(sig.parameters.keys())
+    known_fields = _endpoint_known_fields(endpoint_func)
     kwargs: Dict[str, Any] = {key: value for key, value in form_data.items() if key not in known_fields}
 
     # Handle JSON parameters. They are passed as strings and need to be deserialized.
     if session_state := kwargs.get("session_state"):
         try:
             if isinstance(session_state, str):
-                session_state_dict = json.loads(session_state)  # type: ignore
+                session_state_dict = _json_loads(session_state)  # type: ignore
                 kwargs["session_state"] = session_state_dict
         except json.JSONDecodeError:
             kwargs.pop("session_state")
@@ -62,7 +83,7 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     if dependencies := kwargs.get("dependencies"):
         try:
             if isinstance(dependencies, str):
-                dependencies_dict = json.loads(dependencies)  # type: ignore
+                dependencies_dict = _json_loads(dependencies)  # type: ignore
                 kwargs["dependencies"] = dependencies_dict
         except json.JSONDecodeError:
             kwargs.pop("dependencies")
@@ -71,7 +92,7 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     if metadata := kwargs.get("metadata"):
         try:
             if isinstance(metadata, str):
-                metadata_dict = json.loads(metadata)  # type: ignore
+                metadata_dict = _json_loads(metadata)  # type: ignore
                 kwargs["metadata"] = metadata_dict
         except json.JSONDecodeError:
             kwargs.pop("metadata")
@@ -80,7 +101,7 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     if knowledge_filters := kwargs.get("knowledge_filters"):
         try:
             if isinstance(knowledge_filters, str):
-                knowledge_filters_dict = json.loads(knowledge_filters)  # type: ignore
+                knowledge_filters_dict = _json_loads(knowledge_filters)  # type: ignore
 
                 # Try to deserialize FilterExpr objects
                 from agno.filters import from_dict
@@ -120,7 +141,7 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     if output_schema := kwargs.get("output_schema"):
         try:
             if isinstance(output_schema, str):
-                schema_dict = json.loads(output_schema)
+                schema_dict = _json_loads(output_schema)
 
                 if use_json_schema:
                     # Keep as dict schema for direct JSON output
@@ -146,11 +167,13 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     return kwargs
 
 
-def format_sse_event(event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent]) -> str:
-    """Parse JSON data into SSE-compliant format.
+def format_sse_event(event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent]) -> bytes:
+    """Serialize an event into SSE-compliant bytes.
+
+    Returning bytes lets StreamingResponse emit chunks without re-encoding each one.
 
     Args:
-        event_dict: Dictionary containing the event data
+        event: The run event to serialize
 
     Returns:
         SSE-formatted response:
@@ -163,17 +186,98 @@ def format_sse_event(event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRu
         data: { ... }
         ```
     """
-    try:
-        # Parse the JSON to extract the event type
-        event_type = event.event or "message"
+    event_type = event.event or "message"
+
+    # Use orjson when installed: it serializes straight to compact UTF-8 bytes
+    if orjson is not None:
+        try:
+            data = orjson.dumps(event.to_dict(), default=json_serializer)
+            return b"event: " + event_type.encode("utf-8") + b"\ndata: " + data + b"\n\n"
+        except Exception:
+            pass
+
+    # Serialize to valid JSON with double quotes and no newlines
+    clean_json = event.to_json(separators=(",", ":"), indent=None)
+    return f"event: {event_type}\ndata: {clean_json}\n\n".encode("utf-8")
 
-        # Serialize to valid JSON with double quotes and no newlines
-        clean_json = event.to_json(separators=(",", ":"), indent=None)
 
-        return f"event: {event_type}\ndata: {clean_json}\n\n"
-    except json.JSONDecodeError:
-        clean_json = event.to_json(separators=(",", ":"), indent=None)
-        return f"event: message\ndata: {clean_json}\n\n"
+def serialize_event_dict(data: Dict[str, Any]) -> str:
+    """Serialize an event dict to a compact JSON string in a single pass.
+
+    Uses orjson when installed so the dict is walked once in C; falls back to the
+    stdlib encoder otherwise.
+
+    Args:
+        data: The event payload to serialize
+
+    Returns:
+        The JSON-encoded event payload
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=json_serializer).decode("utf-8")
+        except Exception:
+            pass
+    return json.dumps(data, default=json_serializer)
+
+
+async def coalesce_sse_events(
+    events: AsyncGenerator, max_bytes: int = 4096, max_wait: float = 0.005
+) -> AsyncGenerator[bytes, None]:
+    """Batch consecutive SSE frames into size- and time-bounded chunks.
+
+    Fast-streaming models can emit hundreds of events per second; sending each one
+    individually pays ASGI send + HTTP framing overhead per event. Buffering frames
+    until either `max_bytes` accumulate or `max_wait` seconds pass amortizes that
+    overhead while keeping latency jitter bounded. Concatenated SSE frames remain a
+    valid event stream.
+
+    Args:
+        events: The generator producing SSE-formatted frames (bytes or str)
+        max_bytes: Flush the buffer once it reaches this size
+        max_wait: Flush buffered frames at most this many seconds after the first
+            frame entered the buffer
+    """
+    buffer = bytearray()
+    iterator = events.__aiter__()
+    pending: Optional[asyncio.Future] = None
+    loop = asyncio.get_running_loop()
+    # Absolute flush deadline, armed when the first frame enters the buffer so
+    # steady streams still flush every max_wait instead of only on idle gaps
+    deadline: Optional[float] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if pending not in done:
+                yield bytes(buffer)
+                buffer.clear()
+                deadline = None
+                continue
+
+            try:
+                frame = pending.result()
+            except StopAsyncIteration:
+                break
+            finally:
+                pending = None
+
+            if not buffer:
+                deadline = loop.time() + max_wait
+            buffer += frame if isinstance(frame, bytes) else frame.encode("utf-8")
+            if len(buffer) >= max_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+                deadline = None
+
+        if buffer:
+            yield bytes(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
 
 
 async def get_db(
@@ -373,6 +477,13 @@ def process_image(file: UploadFile) -> Image:
     return Image(content=content, format=extract_format(file), mime_type=file.content_type)
 
 
+async def aprocess_image(file: UploadFile) -> Image:
+    content = await file.read()
+    if not content:
+        raise HTTPException(status_code=400, detail="Empty file")
+    return Image(content=content, format=extract_format(file), mime_type=file.content_type)
+
+
 def process_audio(file: UploadFile) -> Audio:
     content = file.file.read()
     if not content:
@@ -380,6 +491,13 @@ def process_audio(file: UploadFile) -> Audio:
     return Audio(content=content, format=extract_format(file), mime_type=file.content_type)
 
 
+async def aprocess_audio(file: UploadFile) -> Audio:
+    content = await file.read()
+    if not content:
+        raise HTTPException(status_code=400, detail="Empty file")
+    return Audio(content=content, format=extract_format(file), mime_type=file.content_type)
+
+
 def process_video(file: UploadFile) -> Video:
     content = file.file.read()
     if not content:
@@ -387,6 +505,13 @@ def process_video(file: UploadFile) -> Video:
     return Video(content=content, format=extract_format(file), mime_type=file.content_type)
 
 
+async def aprocess_video(file: UploadFile) -> Video:
+    content = await file.read()
+    if not content:
+        raise HTTPException(status_code=400, detail="Empty file")
+    return Video(content=content, format=extract_format(file), mime_type=file.content_type)
+
+
 def process_document(file: UploadFile) -> Optional[FileMedia]:
     try:
         content = file.file.read()
@@ -400,6 +525,19 @@ def process_document(file: UploadFile) -> Optional[FileMedia]:
         return None
 
 
+async def aprocess_document(file: UploadFile) -> Optional[FileMedia]:
+    try:
+        content = await file.read()
+        if not content:
+            raise HTTPException(status_code=400, detail="Empty file")
+        return FileMedia(
+            content=content, filename=file.filename, format=extract_format(file), mime_type=file.content_type
+        )
+    except Exception as e:
+        logger.error(f"Error processing document {file.filename}: {e}")
+        return None
+
+
 def extract_format(file: UploadFile) -> Optional[str]:
     """Extract the File format from file name or content_type."""
     # Get the format from the filename
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from enum import Enum
 from time import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
@@ -603,11 +603,13 @@ class RunOutput:
         return [t for t in self.tools if t.external_execution_required] if self.tools else []
 
     def to_dict(self) -> Dict[str, Any]:
+        # Shallow field scan: asdict() would deep-convert every message and event only
+        # for those entries to be discarded and rebuilt below
         _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+            and f.name
             not in [
                 "messages",
                 "metrics",
@@ -628,6 +630,8 @@ class RunOutput:
                 "requirements",
             ]
         }
+        if "content" in _dict and is_dataclass(self.content) and not isinstance(self.content, type):
+            _dict["content"] = asdict(self.content)
 
         if self.metrics is not None:
             _dict["metrics"] = self.metrics.to_dict() if isinstance(self.metrics, Metrics) else self.metrics
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from enum import Enum
 from time import time
 from typing import Any, Dict, List, Optional, Sequence, Union
@@ -560,11 +560,13 @@ class TeamRunOutput:
         return self.status == RunStatus.cancelled
 
     def to_dict(self) -> Dict[str, Any]:
+        # Shallow field scan: asdict() would deep-convert every message and event only
+        # for those entries to be discarded and rebuilt below
         _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+            and f.name
             not in [
                 "messages",
                 "metrics",
@@ -576,14 +578,23 @@ class TeamRunOutput:
                 "audio",
                 "files",
                 "response_audio",
+                "input",
                 "citations",
                 "events",
+                "member_responses",
                 "additional_input",
                 "reasoning_steps",
                 "reasoning_messages",
                 "references",
+                "requirements",
             ]
         }
+        if "content" in _dict and is_dataclass(self.content) and not isinstance(self.content, type):
+            _dict["content"] = asdict(self.content)
+
+        if self.requirements is not None:
+            _dict["requirements"] = [asdict(req) for req in self.requirements]
+
         if self.events is not None:
             _dict["events"] = [e.to_dict() for e in self.events]
 
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from enum import Enum
 from time import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
@@ -534,17 +534,20 @@ class WorkflowRunOutput:
         return self.status == RunStatus.cancelled
 
     def to_dict(self) -> Dict[str, Any]:
+        # Shallow field scan: asdict() would deep-convert every message and event only
+        # for those entries to be discarded and rebuilt below
         _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+            and f.name
             not in [
                 "metadata",
                 "images",
                 "videos",
                 "audio",
                 "response_audio",
+                "input",
                 "step_results",
                 "step_executor_runs",
                 "events",
@@ -552,6 +555,8 @@ class WorkflowRunOutput:
                 "workflow_agent_run",
             ]
         }
+        if "content" in _dict and is_dataclass(self.content) and not isinstance(self.content, type):
+            _dict["content"] = asdict(self.content)
 
         if self.status is not None:
             _dict["status"] = self.status.value if isinstance(self.status, RunStatus) else self.status
@@ -10,6 +10,8 @@ from agno.models.utils import get_model
 from agno.run.agent import Message
 from agno.utils.log import log_debug, log_warning
 
+_ASSISTANT_ROLES = frozenset({"assistant", "model"})
+
 # TODO: Look into moving all managers into a separate dir
 if TYPE_CHECKING:
     from agno.session import Session
@@ -123,7 +125,7 @@ class SessionSummaryManager:
                     # Skip empty messages with no media
                 else:
                     conversation_messages.append(f"User: {message.content}")
-            elif message.role in ["assistant", "model"]:
+            elif message.role in _ASSISTANT_ROLES:
                 conversation_messages.append(f"Assistant: {message.content}\n")
         system_prompt += "\n".join(conversation_messages)
         system_prompt += "</conversation>"
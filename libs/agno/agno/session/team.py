@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -9,8 +9,11 @@ from agno.models.message import Message
 from agno.run.agent import RunOutput, RunStatus
 from agno.run.team import TeamRunOutput
 from agno.session.summary import SessionSummary
+from agno.session.utils import upsert_run_index
 from agno.utils.log import log_debug, log_warning
 
+_DEFAULT_SKIP_STATUSES = frozenset({RunStatus.paused, RunStatus.cancelled, RunStatus.error})
+
 
 @dataclass
 class TeamSession:
@@ -43,12 +46,21 @@ class TeamSession:
     updated_at: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        session_dict = asdict(self)
-
-        session_dict["runs"] = [run.to_dict() for run in self.runs] if self.runs else None
-        session_dict["summary"] = self.summary.to_dict() if self.summary else None
-
-        return session_dict
+        # Built by hand: asdict() would deep-walk every run and message only for the
+        # result to be overwritten with run.to_dict() anyway
+        return {
+            "session_id": self.session_id,
+            "team_id": self.team_id,
+            "user_id": self.user_id,
+            "workflow_id": self.workflow_id,
+            "team_data": self.team_data,
+            "session_data": self.session_data,
+            "metadata": self.metadata,
+            "runs": [run.to_dict() for run in self.runs] if self.runs else None,
+            "summary": self.summary.to_dict() if self.summary else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> Optional[TeamSession]:
@@ -83,6 +95,11 @@ class TeamSession:
             summary=data.get("summary"),
         )
 
+    # run_id -> index map for the runs list, plus a strong reference to the exact
+    # list it was built from; plain class attributes so asdict() skips them
+    _run_index = None
+    _indexed_runs = None
+
     def get_run(self, run_id: str) -> Optional[Union[TeamRunOutput, RunOutput]]:
         for run in self.runs or []:
             if run.run_id == run_id:
@@ -101,10 +118,9 @@ class TeamSession:
         if not self.runs:
             self.runs = []
 
-        for i, existing_run in enumerate(self.runs or []):
-            if existing_run.run_id == run_response.run_id:
-                self.runs[i] = run_response
-                break
+        idx = upsert_run_index(self, run_response)
+        if idx is not None:
+            self.runs[idx] = run_response
         else:
             self.runs.append(run_response)
 
@@ -120,6 +136,7 @@ class TeamSession:
         skip_statuses: Optional[List[RunStatus]] = None,
         skip_history_messages: bool = True,
         skip_member_messages: bool = True,
+        run_filter: Optional[Callable[[Union[TeamRunOutput, RunOutput]], bool]] = None,
     ) -> List[Message]:
         """Returns the messages belonging to the session that fit the given criteria.
 
@@ -132,6 +149,8 @@ class TeamSession:
             skip_statuses: Skip messages with these statuses.
             skip_history_messages: Skip messages that were tagged as history in previous runs.
             skip_member_messages: Skip messages created by members of the team.
+            run_filter: Optional predicate evaluated per run. Runs it rejects are skipped
+                wholesale, before any of their messages are inspected.
 
         Returns:
             A list of Messages belonging to the session.
@@ -142,7 +161,7 @@ class TeamSession:
         ) -> bool:
             """Processes a message for history"""
             # Skip messages that were tagged as history in previous runs
-            if hasattr(message, "from_history") and message.from_history and skip_history_messages:
+            if skip_history_messages and message.from_history:
                 return True
 
             # Skip messages with specified role
@@ -157,23 +176,26 @@ class TeamSession:
         if not self.runs:
             return []
 
-        if skip_statuses is None:
-            skip_statuses = [RunStatus.paused, RunStatus.cancelled, RunStatus.error]
-
-        session_runs = self.runs
-
-        # Filter by team_id and member_ids
-        if team_id:
-            session_runs = [run for run in session_runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
-        if member_ids:
-            session_runs = [run for run in session_runs if hasattr(run, "agent_id") and run.agent_id in member_ids]  # type: ignore
-
-        if skip_member_messages:
-            # Filter for the top-level runs (main team runs or agent runs when sharing session)
-            session_runs = [run for run in session_runs if run.parent_run_id is None]  # type: ignore
-
-        # Filter by status
-        session_runs = [run for run in session_runs if hasattr(run, "status") and run.status not in skip_statuses]  # type: ignore
+        # Normalized once so the per-message and per-run membership tests are O(1)
+        skip_status_set = _DEFAULT_SKIP_STATUSES if skip_statuses is None else frozenset(skip_statuses)
+        if skip_roles:
+            skip_roles = frozenset(skip_roles)  # type: ignore
+
+        # Run-level filters applied in one pass, so rejected runs are dropped before
+        # any of their messages are touched:
+        # - team_id / member_ids scoping
+        # - member runs (keeping only top-level team or shared-session agent runs)
+        # - skipped statuses
+        # - the caller's run_filter predicate, if given
+        session_runs = [
+            run
+            for run in self.runs
+            if (not team_id or (hasattr(run, "team_id") and run.team_id == team_id))  # type: ignore
+            and (not member_ids or (hasattr(run, "agent_id") and run.agent_id in member_ids))  # type: ignore
+            and (not skip_member_messages or run.parent_run_id is None)
+            and (hasattr(run, "status") and run.status not in skip_status_set)
+            and (run_filter is None or run_filter(run))
+        ]
 
         messages_from_history = []
         system_message = None
@@ -202,9 +224,13 @@ class TeamSession:
             else:
                 messages_from_history = messages_from_history[-limit:]
 
-            # Remove tool result messages that don't have an associated assistant message with tool calls
-            while len(messages_from_history) > 0 and messages_from_history[0].role == "tool":
-                messages_from_history.pop(0)
+            # Remove tool result messages that don't have an associated assistant message with tool calls.
+            # One slice instead of repeated pop(0), which shifts the whole list per removal
+            first_non_tool = 0
+            while first_non_tool < len(messages_from_history) and messages_from_history[first_non_tool].role == "tool":
+                first_non_tool += 1
+            if first_non_tool:
+                messages_from_history = messages_from_history[first_non_tool:]
         else:
             # Filter by last_n runs
             runs_to_process = session_runs[-last_n_runs:] if last_n_runs is not None else session_runs
@@ -243,19 +269,18 @@ class TeamSession:
     def get_tool_calls(self, num_calls: Optional[int] = None) -> List[Dict[str, Any]]:
         """Returns a list of tool calls from the messages"""
 
-        tool_calls = []
-        session_runs = self.runs
-        if session_runs is None:
+        tool_calls: List[Dict[str, Any]] = []
+        if self.runs is None:
             return []
 
-        for run_response in session_runs[::-1]:
+        # reversed() iterates newest-first without materializing a copy of the runs list
+        for run_response in reversed(self.runs):
             if run_response and run_response.messages:
-                for message in run_response.messages or []:
+                for message in run_response.messages:
                     if message.tool_calls:
-                        for tool_call in message.tool_calls:
-                            tool_calls.append(tool_call)
-                            if num_calls and len(tool_calls) >= num_calls:
-                                return tool_calls
+                        tool_calls.extend(message.tool_calls)
+                        if num_calls and len(tool_calls) >= num_calls:
+                            return tool_calls[:num_calls]
         return tool_calls
 
     def get_team_history(self, num_runs: Optional[int] = None) -> List[Tuple[str, str]]:
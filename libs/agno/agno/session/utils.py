@@ -0,0 +1,33 @@
+from typing import Any, Optional
+
+
+def upsert_run_index(session: Any, run: Any) -> Optional[int]:
+    """Return the index of an existing run with the same run_id, or None.
+
+    Keeps a run_id -> index map beside the session's runs list so repeated upserts
+    stay O(1) instead of rescanning the list. The map is invalidated when the runs
+    list is no longer the exact object that was indexed, so replacing the list
+    externally (even with one of the same length) triggers a rebuild. The indexed
+    list is held by strong reference: that keeps the ``is`` comparison sound, since
+    a live object's identity cannot be reused by a new list.
+
+    The session is expected to carry ``_run_index`` and ``_indexed_runs`` as plain
+    class attributes, so ``asdict()`` skips them.
+    """
+    runs = session.runs or []
+    run_index = session._run_index
+    if run_index is None or session._indexed_runs is not runs:
+        run_index = {existing.run_id: i for i, existing in enumerate(runs)}
+        session._run_index = run_index
+        session._indexed_runs = runs
+
+    idx = run_index.get(run.run_id)
+    if idx is not None and (idx >= len(runs) or runs[idx].run_id != run.run_id):
+        # The list was rearranged in place; rebuild and retry
+        run_index = {existing.run_id: i for i, existing in enumerate(runs)}
+        session._run_index = run_index
+        idx = run_index.get(run.run_id)
+
+    if idx is None:
+        run_index[run.run_id] = len(runs)
+    return idx
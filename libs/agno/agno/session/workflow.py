@@ -11,6 +11,7 @@ from agno.run.agent import RunOutput
 from agno.run.base import RunStatus
 from agno.run.team import TeamRunOutput
 from agno.run.workflow import WorkflowRunOutput
+from agno.session.utils import upsert_run_index
 from agno.utils.log import log_debug, logger
 
 
@@ -123,6 +124,11 @@ class WorkflowSession:
         if self.updated_at is None:
             self.updated_at = current_time
 
+    # run_id -> index map for the runs list, plus a strong reference to the exact
+    # list it was built from; plain class attributes so asdict() skips them
+    _run_index = None
+    _indexed_runs = None
+
     def get_run(self, run_id: str) -> Optional[WorkflowRunOutput]:
         for run in self.runs or []:
             if run.run_id == run_id:
@@ -135,10 +141,9 @@ class WorkflowSession:
             self.runs = []
 
         # Find existing run and update it, or append new one
-        for i, existing_run in enumerate(self.runs):
-            if existing_run.run_id == run.run_id:
-                self.runs[i] = run
-                break
+        idx = upsert_run_index(self, run)
+        if idx is not None:
+            self.runs[idx] = run
         else:
             self.runs.append(run)
 
@@ -236,7 +241,7 @@ class WorkflowSession:
         ) -> bool:
             """Logic to determine if a message should be skipped"""
             # Skip messages that were tagged as history in previous runs
-            if hasattr(message, "from_history") and message.from_history and skip_history_messages:
+            if skip_history_messages and message.from_history:
                 return True
 
             # Skip messages with specified role
@@ -245,8 +250,12 @@ class WorkflowSession:
 
             return False
 
+        if skip_roles:
+            skip_roles = frozenset(skip_roles)  # type: ignore
+
         # Filter by status
         if skip_statuses:
+            skip_statuses = frozenset(skip_statuses)  # type: ignore
             runs = [run for run in runs if hasattr(run, "status") and run.status not in skip_statuses]  # type: ignore
 
         messages_from_history = []
@@ -276,9 +285,13 @@ class WorkflowSession:
             else:
                 messages_from_history = messages_from_history[-limit:]
 
-            # Remove tool result messages that don't have an associated assistant message with tool calls
-            while len(messages_from_history) > 0 and messages_from_history[0].role == "tool":
-                messages_from_history.pop(0)
+            # Remove tool result messages that don't have an associated assistant message with tool calls.
+            # One slice instead of repeated pop(0), which shifts the whole list per removal
+            first_non_tool = 0
+            while first_non_tool < len(messages_from_history) and messages_from_history[first_non_tool].role == "tool":
+                first_non_tool += 1
+            if first_non_tool:
+                messages_from_history = messages_from_history[first_non_tool:]
 
         # If limit is not set, return all messages
         else:
@@ -334,7 +347,7 @@ class WorkflowSession:
         ) -> bool:
             """Logic to determine if a message should be skipped"""
             # Skip messages that were tagged as history in previous runs
-            if hasattr(message, "from_history") and message.from_history and skip_history_messages:
+            if skip_history_messages and message.from_history:
                 return True
 
             # Skip messages with specified role
@@ -347,8 +360,12 @@ class WorkflowSession:
         if skip_member_messages:
             session_runs = [run for run in runs if run.team_id == team_id]
 
+        if skip_roles:
+            skip_roles = frozenset(skip_roles)  # type: ignore
+
         # Filter runs by status
         if skip_statuses:
+            skip_statuses = frozenset(skip_statuses)  # type: ignore
             session_runs = [run for run in session_runs if hasattr(run, "status") and run.status not in skip_statuses]
 
         messages_from_history = []
@@ -378,9 +395,13 @@ class WorkflowSession:
             else:
                 messages_from_history = messages_from_history[-limit:]
 
-            # Remove tool result messages that don't have an associated assistant message with tool calls
-            while len(messages_from_history) > 0 and messages_from_history[0].role == "tool":
-                messages_from_history.pop(0)
+            # Remove tool result messages that don't have an associated assistant message with tool calls.
+            # One slice instead of repeated pop(0), which shifts the whole list per removal
+            first_non_tool = 0
+            while first_non_tool < len(messages_from_history) and messages_from_history[first_non_tool].role == "tool":
+                first_non_tool += 1
+            if first_non_tool:
+                messages_from_history = messages_from_history[first_non_tool:]
         else:
             # Filter by last_n runs
             runs_to_process = session_runs[-last_n_runs:] if last_n_runs is not None else session_runs
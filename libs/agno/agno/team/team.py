@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -3589,7 +3590,9 @@ class Team:
                 # Don't yield anything
                 return
         else:
-            model_response_event = cast(ModelResponse, model_response_event)
+            if TYPE_CHECKING:
+                # Narrow the type for checkers only; a runtime cast() here would run once per streamed event
+                model_response_event = cast(ModelResponse, model_response_event)
             # If the model response is an assistant_response, yield a RunOutput
             if model_response_event.event == ModelResponseEvent.assistant_response.value:
                 content_type = "str"
@@ -7027,15 +7030,14 @@ class Team:
             """
             import json
 
-            history: List[Dict[str, Any]] = []
-
             all_chats = session.get_messages(team_id=self.id)
 
             if len(all_chats) == 0:
                 return ""
 
-            for chat in all_chats[::-1]:  # type: ignore
-                history.insert(0, chat.to_dict())  # type: ignore
+            # Single forward pass; the reversed copy + insert(0) dance rebuilt the
+            # original order at O(n^2)
+            history: List[Dict[str, Any]] = [chat.to_dict() for chat in all_chats]
 
             if num_chats is not None:
                 history = history[:num_chats]
@@ -7061,15 +7063,14 @@ class Team:
             """
             import json
 
-            history: List[Dict[str, Any]] = []
-
             all_chats = session.get_messages(team_id=self.id)
 
             if len(all_chats) == 0:
                 return ""
 
-            for chat in all_chats[::-1]:  # type: ignore
-                history.insert(0, chat.to_dict())  # type: ignore
+            # Single forward pass; the reversed copy + insert(0) dance rebuilt the
+            # original order at O(n^2)
+            history: List[Dict[str, Any]] = [chat.to_dict() for chat in all_chats]
 
             if num_chats is not None:
                 history = history[:num_chats]
@@ -8981,12 +8982,13 @@ class Team:
         # Extract dependencies from run_context if available
         dependencies = run_context.dependencies if run_context else None
 
-        if num_documents is None and self.knowledge is not None:
-            num_documents = self.knowledge.max_results
+        knowledge = self.knowledge
+        if num_documents is None and knowledge is not None:
+            num_documents = knowledge.max_results
 
         # Validate the filters against known valid filter keys
-        if self.knowledge is not None:
-            valid_filters, invalid_keys = self.knowledge.validate_filters(filters)  # type: ignore
+        if knowledge is not None:
+            valid_filters, invalid_keys = knowledge.validate_filters(filters)  # type: ignore
 
             # Warn about invalid filter keys
             if invalid_keys:
@@ -9023,16 +9025,14 @@ class Team:
                 log_warning(f"Knowledge retriever failed: {e}")
                 raise e
         try:
-            if self.knowledge is None or self.knowledge.vector_db is None:
+            if knowledge is None or knowledge.vector_db is None:
                 return None
 
             if num_documents is None:
-                num_documents = self.knowledge.max_results
+                num_documents = knowledge.max_results
 
             log_debug(f"Searching knowledge base with filters: {filters}")
-            relevant_docs: List[Document] = self.knowledge.search(
-                query=query, max_results=num_documents, filters=filters
-            )
+            relevant_docs: List[Document] = knowledge.search(query=query, max_results=num_documents, filters=filters)
 
             if not relevant_docs or len(relevant_docs) == 0:
                 log_debug("No relevant documents found for query")
@@ -9057,12 +9057,13 @@ class Team:
         # Extract dependencies from run_context if available
         dependencies = run_context.dependencies if run_context else None
 
-        if num_documents is None and self.knowledge is not None:
-            num_documents = self.knowledge.max_results
+        knowledge = self.knowledge
+        if num_documents is None and knowledge is not None:
+            num_documents = knowledge.max_results
 
         # Validate the filters against known valid filter keys
-        if self.knowledge is not None:
-            valid_filters, invalid_keys = await self.knowledge.async_validate_filters(filters)  # type: ignore
+        if knowledge is not None:
+            valid_filters, invalid_keys = await knowledge.async_validate_filters(filters)  # type: ignore
 
             # Warn about invalid filter keys
             if invalid_keys:
@@ -9106,14 +9107,14 @@ class Team:
                 raise e
 
         try:
-            if self.knowledge is None or self.knowledge.vector_db is None:
+            if knowledge is None or knowledge.vector_db is None:
                 return None
 
             if num_documents is None:
-                num_documents = self.knowledge.max_results
+                num_documents = knowledge.max_results
 
             log_debug(f"Searching knowledge base with filters: {filters}")
-            relevant_docs: List[Document] = await self.knowledge.async_search(
+            relevant_docs: List[Document] = await knowledge.async_search(
                 query=query, max_results=num_documents, filters=filters
             )
 
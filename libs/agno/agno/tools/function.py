@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from functools import partial
 from importlib.metadata import version
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, TypeVar, get_type_hints
+from weakref import WeakKeyDictionary
 
 from docstring_parser import parse
 from packaging.version import Version
@@ -14,6 +15,14 @@ from agno.utils.log import log_debug, log_error, log_exception, log_warning
 
 T = TypeVar("T")
 
+# Computed (parameters, description) per entrypoint and strict mode. Agents deep-copy
+# every Function and re-run process_entrypoint at construction, so without this the
+# signature, type-hint and docstring introspection repeats for each Agent that shares
+# a toolkit. Weak keys keep entries alive exactly as long as the entrypoint they describe.
+_processed_schema_cache: "WeakKeyDictionary[Callable, Dict[bool, Tuple[Dict[str, Any], Optional[str]]]]" = (
+    WeakKeyDictionary()
+)
+
 
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
@@ -145,10 +154,21 @@ class Function(BaseModel):
     _files: Optional[Sequence[File]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return self.model_dump(
-            exclude_none=True,
-            include={"name", "description", "parameters", "strict", "requires_confirmation", "external_execution"},
-        )
+        # Read the attributes directly: model_dump(include=...) dispatches through
+        # Pydantic's serializer for the whole schema just to keep six fields, and this
+        # runs for every tool on every model request
+        return {
+            k: v
+            for k, v in (
+                ("name", self.name),
+                ("description", self.description),
+                ("parameters", self.parameters),
+                ("strict", self.strict),
+                ("requires_confirmation", self.requires_confirmation),
+                ("external_execution", self.external_execution),
+            )
+            if v is not None
+        }
 
     def model_copy(self, *, deep: bool = False) -> "Function":
         """
@@ -321,6 +341,7 @@ class Function(BaseModel):
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
+        from copy import deepcopy
         from inspect import getdoc, signature
 
         from agno.utils.json_schema import get_json_schema
@@ -340,6 +361,20 @@ class Function(BaseModel):
         if self.parameters != parameters:
             params_set_by_user = True
 
+        # The computed schema depends only on the entrypoint and strict mode, unless the
+        # user overrode the parameters or requested user input, so reuse it across copies
+        cacheable = not params_set_by_user and not self.requires_user_input
+        if cacheable:
+            cached = _processed_schema_cache.get(self.entrypoint, {}).get(strict)
+            if cached is not None:
+                self.parameters = deepcopy(cached[0])
+                self.description = self.description or cached[1]
+                try:
+                    self.entrypoint = self._wrap_callable(self.entrypoint)
+                except Exception as e:
+                    log_warning(f"Failed to add validate decorator to entrypoint: {e}")
+                return
+
         if self.requires_user_input:
             self.user_input_schema = self.user_input_schema or []
 
@@ -455,6 +490,7 @@ class Function(BaseModel):
             # log_debug(f"JSON schema for {self.name}: {parameters}")
         except Exception as e:
             log_warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
+            cacheable = False
 
         if not params_set_by_user:
             self.parameters = parameters
@@ -462,6 +498,16 @@ class Function(BaseModel):
         if strict:
             self.process_schema_for_strict()
 
+        if cacheable:
+            try:
+                _processed_schema_cache.setdefault(self.entrypoint, {})[strict] = (
+                    deepcopy(self.parameters),
+                    self.description,
+                )
+            except TypeError:
+                # Entrypoints that do not support weak references are simply not cached
+                pass
+
         try:
             self.entrypoint = self._wrap_callable(self.entrypoint)
         except Exception as e:
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def boto_session():
+    """One boto3 session for the whole test session, so credential resolution and
+    botocore's service-data loading run once per worker instead of per module."""
+    from boto3.session import Session
+
+    return Session()
@@ -5,6 +5,9 @@ from agno.agent import Agent, RunOutput
 from agno.db.sqlite.sqlite import SqliteDb
 from agno.models.aws import AwsBedrock
 
+# Every test here is a live Bedrock round trip
+pytestmark = pytest.mark.slow
+
 
 def _assert_metrics(response: RunOutput):
     assert response.metrics is not None
@@ -8,20 +8,29 @@ from agno.media import File, Image
 from agno.models.aws import AwsBedrock
 from agno.utils.media import download_file
 
+# Every test here is a live Bedrock round trip
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="session")
+def image_bytes():
+    """Read the sample image once for the whole test session instead of once per test."""
+    return Path(__file__).parent.parent.parent.joinpath("resources/sample_image.jpg").read_bytes()
+
+
+@pytest.fixture(scope="module")
+def bedrock_agent(boto_session):
+    """Shared agent so the boto client and credential chain are initialized once per module."""
+    return Agent(model=AwsBedrock(id="amazon.nova-pro-v1:0", session=boto_session), markdown=True, telemetry=False)
+
 
 @pytest.mark.asyncio
-async def test_async_image_input_bytes():
+async def test_async_image_input_bytes(bedrock_agent, image_bytes):
     """Test async image input using bytes with Amazon Nova Pro model.
 
     Only bytes input is supported for multimodal models.
     """
-    agent = Agent(model=AwsBedrock(id="amazon.nova-pro-v1:0"), markdown=True, telemetry=False)
-
-    image_path = Path(__file__).parent.parent.parent.joinpath("resources/sample_image.jpg")
-
-    image_bytes = image_path.read_bytes()
-
-    response = await agent.arun(
+    response = await bedrock_agent.arun(
         "Tell me about this image.",
         images=[Image(content=image_bytes, format="jpeg")],
     )
@@ -30,32 +39,24 @@ async def test_async_image_input_bytes():
 
 
 @pytest.mark.asyncio
-async def test_async_image_input_stream():
+async def test_async_image_input_stream(bedrock_agent, image_bytes):
     """Test async image input with streaming using Amazon Nova Pro model."""
-    agent = Agent(model=AwsBedrock(id="amazon.nova-pro-v1:0"), markdown=True, telemetry=False)
-
-    image_path = Path(__file__).parent.parent.parent.joinpath("resources/sample_image.jpg")
-    image_bytes = image_path.read_bytes()
-
-    full_response_content = ""
-    async for response in agent.arun(
+    content_parts = []
+    async for response in bedrock_agent.arun(
         "Describe this image in detail.", images=[Image(content=image_bytes, format="jpeg")], stream=True
     ):
-        full_response_content += response.content or ""
+        if response.content:
+            content_parts.append(response.content)
+    full_response_content = "".join(content_parts)
 
     assert len(full_response_content) > 0
     assert "bridge" in full_response_content.lower()
 
 
 @pytest.mark.asyncio
-async def test_async_multiple_images():
+async def test_async_multiple_images(bedrock_agent, image_bytes):
     """Test async processing of multiple images."""
-    agent = Agent(model=AwsBedrock(id="amazon.nova-pro-v1:0"), markdown=True, telemetry=False)
-
-    image_path = Path(__file__).parent.parent.parent.joinpath("resources/sample_image.jpg")
-    image_bytes = image_path.read_bytes()
-
-    response = await agent.arun(
+    response = await bedrock_agent.arun(
         "Compare these two images and tell me what you see.",
         images=[Image(content=image_bytes, format="jpeg"), Image(content=image_bytes, format="jpeg")],
     )
@@ -64,12 +65,10 @@ async def test_async_multiple_images():
     assert len(response.content) > 0
 
 
-def test_pdf_file_input_from_url():
+def test_pdf_file_input_from_url(bedrock_agent):
     """
     Test PDF file input by downloading from URL
     """
-    agent = Agent(model=AwsBedrock(id="amazon.nova-pro-v1:0"), markdown=True, telemetry=False)
-
     # Download PDF from URL to temporary file
     with tempfile.NamedTemporaryFile(suffix=".pdf") as temp_file:
         download_file("https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf", temp_file.name)
@@ -77,7 +76,7 @@ def test_pdf_file_input_from_url():
         # Read as bytes (required for AWS Bedrock)
         pdf_bytes = Path(temp_file.name).read_bytes()
 
-        response = agent.run(
+        response = bedrock_agent.run(
             "What type of document is this? Give me a brief summary.",
             files=[File(content=pdf_bytes, format="pdf", name="Thai Recipes")],
         )
@@ -217,7 +217,9 @@ async def test_acreate_user_memories_with_async_db():
     result = await manager.acreate_user_memories(message="Remember the milk", user_id="user-1")
 
     assert result == "ok"
-    assert async_db.calls[:2] == [("get_user_memories", "user-1"), ("get_user_memories", "user-1")]
+    # Existing memories are read once before the write; the write path updates the
+    # DB directly, so no refresh read follows
+    assert async_db.calls == [("get_user_memories", "user-1")]
 
     user_memories = await manager.aget_user_memories(user_id="user-1")
     assert len(user_memories) == 1
@@ -255,7 +257,7 @@ async def test_aupdate_memory_task_refreshes_async_db():
     response = await manager.aupdate_memory_task(task="Sync state", user_id="user-2")
 
     assert response == "updated"
-    assert async_db.calls[:2] == [("get_user_memories", "user-2"), ("get_user_memories", "user-2")]
+    assert async_db.calls == [("get_user_memories", "user-2")]
 
     saved_memories = await manager.aget_user_memories(user_id="user-2")
     assert len(saved_memories) == 1
@@ -0,0 +1,31 @@
+"""Tests for the workflow router's lazy workflow lookup."""
+
+from fastapi.testclient import TestClient
+
+from agno.os import AgentOS
+from agno.workflow.workflow import Workflow
+
+
+def test_get_workflow_found():
+    """A workflow not yet in the lazy index is resolved from os.workflows."""
+    workflow = Workflow(name="Test Workflow", id="workflow-1")
+    agent_os = AgentOS(workflows=[workflow], telemetry=False)
+
+    client = TestClient(agent_os.get_app())
+    response = client.get("/workflows/workflow-1")
+    assert response.status_code == 200
+    assert response.json()["id"] == "workflow-1"
+
+    # Second request is served from the index
+    response = client.get("/workflows/workflow-1")
+    assert response.status_code == 200
+
+
+def test_get_workflow_not_found():
+    """An unknown workflow id returns 404 instead of erroring."""
+    workflow = Workflow(name="Test Workflow", id="workflow-1")
+    agent_os = AgentOS(workflows=[workflow], telemetry=False)
+
+    client = TestClient(agent_os.get_app())
+    response = client.get("/workflows/unknown-workflow")
+    assert response.status_code == 404
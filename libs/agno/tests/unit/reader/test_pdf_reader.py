@@ -102,6 +102,25 @@ async def test_pdf_image_reader_async(sample_pdf_path):
     assert all(doc.content for doc in documents)
 
 
+def test_pdf_reader_iter_pages(sample_pdf_path):
+    reader = PDFReader(chunk=False)
+    documents = list(reader.iter_pages(sample_pdf_path))
+
+    assert len(documents) > 0
+    assert all("ThaiRecipes" in doc.name for doc in documents)
+    assert all(isinstance(doc.meta_data.get("page"), int) for doc in documents)
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_async_iter_pages(sample_pdf_path):
+    reader = PDFReader(chunk=False)
+    documents = [doc async for doc in reader.async_iter_pages(sample_pdf_path)]
+
+    assert len(documents) > 0
+    assert all("ThaiRecipes" in doc.name for doc in documents)
+    assert all(isinstance(doc.meta_data.get("page"), int) for doc in documents)
+
+
 def test_pdf_reader_invalid_file():
     reader = PDFReader()
     with pytest.raises(Exception):
@@ -0,0 +1,65 @@
+"""Tests for the shared run-index upsert helper used by the session classes."""
+
+from agno.run.agent import RunOutput
+from agno.run.team import TeamRunOutput
+from agno.run.workflow import WorkflowRunOutput
+from agno.session.agent import AgentSession
+from agno.session.team import TeamSession
+from agno.session.workflow import WorkflowSession
+
+
+def test_upsert_run_appends_and_updates():
+    session = AgentSession(session_id="session-1")
+
+    session.upsert_run(RunOutput(run_id="run-1", content="first"))
+    session.upsert_run(RunOutput(run_id="run-2"))
+    assert [run.run_id for run in session.runs] == ["run-1", "run-2"]
+
+    # Same run_id updates in place instead of appending
+    session.upsert_run(RunOutput(run_id="run-1", content="second"))
+    assert [run.run_id for run in session.runs] == ["run-1", "run-2"]
+    assert session.runs[0].content == "second"
+
+
+def test_upsert_run_after_runs_list_replaced():
+    """Replacing session.runs with a different same-length list must not leave a stale index."""
+    session = AgentSession(session_id="session-1")
+    session.upsert_run(RunOutput(run_id="run-1"))
+    session.upsert_run(RunOutput(run_id="run-2"))
+
+    # Replace the list externally: same length, different contents and order
+    session.runs = [RunOutput(run_id="run-3"), RunOutput(run_id="run-1")]
+
+    session.upsert_run(RunOutput(run_id="run-1", content="updated"))
+    assert [run.run_id for run in session.runs] == ["run-3", "run-1"]
+    assert session.runs[1].content == "updated"
+
+
+def test_upsert_run_after_two_step_replacement():
+    """Clearing runs and assigning a fresh list must not resurrect the stale index.
+
+    CPython reuses freed list addresses immediately, so the replacement list often
+    gets the old list's id(); the index must be compared against a kept reference,
+    not an id snapshot, or the upsert appends a duplicate run_id.
+    """
+    session = AgentSession(session_id="session-1")
+    session.upsert_run(RunOutput(run_id="run-1"))
+
+    session.runs = None
+    session.runs = [RunOutput(run_id="run-1")]
+
+    session.upsert_run(RunOutput(run_id="run-1", content="updated"))
+    assert [run.run_id for run in session.runs] == ["run-1"]
+    assert session.runs[0].content == "updated"
+
+
+def test_upsert_run_team_and_workflow_sessions():
+    team_session = TeamSession(session_id="session-1")
+    team_session.upsert_run(TeamRunOutput(run_id="run-1"))
+    team_session.upsert_run(TeamRunOutput(run_id="run-1"))
+    assert len(team_session.runs) == 1
+
+    workflow_session = WorkflowSession(session_id="session-1")
+    workflow_session.upsert_run(WorkflowRunOutput(run_id="run-1"))
+    workflow_session.upsert_run(WorkflowRunOutput(run_id="run-1"))
+    assert len(workflow_session.runs) == 1